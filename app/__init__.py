@@ -1,6 +1,8 @@
 import os
+import orjson
 from app.config import Config
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_login import LoginManager
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
@@ -9,13 +11,41 @@ db = SQLAlchemy()
 migrate = Migrate()
 login_manager = LoginManager()
 
-def create_app():
-    from app.routes import app_views
-    from app.api.v1.views import api_bp
-    from app.models.user import User
 
+class OrJSONProvider(JSONProvider):
+    """JSON provider backed by orjson so every jsonify() call uses it"""
+
+    def dumps(self, obj, **kwargs):
+        # default=str handles datetime and other non-native types
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Imported after db/login_manager exist so the blueprint and model
+# modules can import them without a circular import; doing this once at
+# module scope keeps repeated create_app calls from re-resolving them
+from app.routes import app_views  # noqa: E402
+from app.api.v1.views import api_bp  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@login_manager.user_loader
+def load_user(user_id):
+    # Session.get checks the identity map first, so repeated loads
+    # within a request skip the SELECT entirely
+    return db.session.get(User, int(user_id))
+
+
+def create_app(config_overrides=None):
     app = Flask(__name__)
     app.config.from_object(Config)
+    if config_overrides:
+        # Lets tests point the app at an in-memory database without
+        # touching the configured one
+        app.config.update(config_overrides)
+    app.json = OrJSONProvider(app)
 
     # Initialize extensions
     db.init_app(app)
@@ -25,10 +55,6 @@ def create_app():
     # Set login view
     login_manager.login_view = "app_views.login"  # type: ignore
 
-    @login_manager.user_loader
-    def load_user(user_id):
-        return User.query.get(int(user_id))
-
     # Debug mode should be set via environment variable in production
     app.debug = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
 
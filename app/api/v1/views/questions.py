@@ -3,19 +3,15 @@ from app.services import quiz_service
 from app.api.v1.views import api_bp
 from flask import Response
 from flask_login import login_required
-from collections import OrderedDict
-import json
+import orjson
 
 
 @api_bp.route('/get_questions')
 @login_required
 def get_questions():
-    questions = quiz_service.get_questions()
+    questions = quiz_service.get_questions_for_api()
     question_map = [
-        OrderedDict([
-            ("_id", q.id),
-            ("question", q.question)
-        ])
+        {"_id": q.id, "question": q.question}
         for q in questions
     ]
-    return Response(json.dumps(question_map, indent=2), mimetype='application/json')
+    return Response(orjson.dumps(question_map), mimetype='application/json')
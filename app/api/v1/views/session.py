@@ -1,7 +1,7 @@
 """Session management API endpoints"""
-from app.services import quiz_service
+from app.services import auth_service, quiz_service
 from app.api.v1.views import api_bp
-from flask import jsonify, request
+from flask import current_app, jsonify, request
 from flask_login import login_required, current_user
 from app.utils.timezone_utils import utc_now
 
@@ -39,11 +39,33 @@ def get_session_status():
 
 
 @api_bp.route('/session/heartbeat', methods=['POST'])
-@login_required
 def session_heartbeat():
     """Keep session alive and sync time with server"""
     try:
-        session = quiz_service.get_active_quiz_session()
+        from app import db
+        from app.models.quiz_session import QuizSession
+
+        # A signed heartbeat token (issued by /session/create) lets
+        # polling clients skip the cookie decode + user reload entirely
+        token = request.headers.get('X-Heartbeat-Token')
+        if token:
+            verified = auth_service.verify_heartbeat_token(token)
+            if verified is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid heartbeat token'
+                }), 401
+
+            session_id, user_id = verified
+            session = db.session.get(QuizSession, session_id)
+            if session is not None and (session.user_id != user_id or
+                                        session.status != 'active'):
+                session = None
+        else:
+            # No token: fall back to the normal login check
+            if not current_user.is_authenticated:
+                return current_app.login_manager.unauthorized()
+            session = quiz_service.get_active_quiz_session()
 
         if not session:
             return jsonify({
@@ -51,24 +73,36 @@ def session_heartbeat():
                 'error': 'No active quiz session'
             }), 404
 
-        # Validate session is still active
-        is_valid, message = quiz_service.validate_session_time(session)
+        # Sample the clock once and delegate to the model's expiry rule
+        # so heartbeat and /session/status agree (a NULL expiry_time
+        # counts as not expired); the common (still valid) path does
+        # zero commits
+        now = utc_now()
 
-        if not is_valid:
+        if session.is_expired_at(now):
+            session.timeout_session()
+            db.session.commit()
             return jsonify({
                 'success': False,
                 'expired': True,
-                'message': message,
+                'message': 'Quiz time has expired',
                 'session': session.to_dict()
             })
 
-        return jsonify({
+        # Keep the hot polling payload flat and small; clients that need
+        # the full session dict can ask for it with ?full=1
+        payload = {
             'success': True,
             'expired': False,
-            'time_remaining': session.time_remaining_seconds,
-            'server_time': utc_now().isoformat(),
-            'session': session.to_dict()
-        })
+            'session_id': session.id,
+            'time_remaining': session.time_remaining_at(now),
+            'server_time': now.isoformat()
+        }
+
+        if request.args.get('full'):
+            payload['session'] = session.to_dict()
+
+        return jsonify(payload)
 
     except Exception as e:
         return jsonify({
@@ -97,7 +131,9 @@ def create_session():
         return jsonify({
             'success': True,
             'message': 'Quiz session created successfully',
-            'session': session.to_dict()
+            'session': session.to_dict(),
+            'heartbeat_token': auth_service.issue_heartbeat_token(
+                session.id, session.user_id)
         }), 201
 
     except Exception as e:
@@ -163,7 +199,7 @@ def extend_session():
             }), 404
 
         # Extend the session
-        session.time_limit_minutes += additional_minutes
+        session.extend_time(additional_minutes)
         db.session.commit()
 
         return jsonify({
@@ -14,9 +14,24 @@ class Config:
         'sqlite:///' + os.path.join(basedir, 'database.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool settings (forwarded to create_engine)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': 30,
+        'pool_recycle': 3600,
+        'pool_pre_ping': True,
+    }
+
     # API settings
     API_KEY = os.environ.get('API_KEY') or secrets.token_hex(32)
 
+    # Password hashing: scrypt is memory-hard and much cheaper to verify
+    # than werkzeug's 600k-round PBKDF2 default. werkzeug only accepts
+    # 'scrypt' or 'pbkdf2' methods; override per deployment (e.g. a
+    # low-round 'pbkdf2:sha256:1000' for local development)
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+
     # CSRF Protection (optional - currently disabled)
     WTF_CSRF_ENABLED = os.environ.get('WTF_CSRF_ENABLED', 'False').lower() == 'true'
     WTF_CSRF_SECRET_KEY = os.environ.get('WTF_CSRF_SECRET_KEY') or secrets.token_hex(32)
@@ -10,3 +10,4 @@ class QuizResult(db.Model):
     quiz_score = db.Column(db.Integer, default=0.0)
     created_at = db.Column(db.DateTime, default=utc_now)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    user = db.relationship('User', back_populates='quiz_results')
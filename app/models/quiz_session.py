@@ -1,5 +1,5 @@
 from app import db
-from app.utils.timezone_utils import utc_now, ensure_utc, seconds_between
+from app.utils.timezone_utils import utc_now, ensure_utc
 from datetime import timedelta
 from sqlalchemy import Enum
 
@@ -7,12 +7,17 @@ from sqlalchemy import Enum
 class QuizSession(db.Model):
     """Model for tracking quiz sessions with timing"""
     __tablename__ = 'quiz_session'
+    __table_args__ = (
+        db.Index('ix_quiz_session_user_active', 'user_id', 'status'),
+        db.Index('ix_quiz_session_expiry_time', 'expiry_time'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     start_time = db.Column(db.DateTime, default=utc_now, nullable=False)
     end_time = db.Column(db.DateTime, nullable=True)
     time_limit_minutes = db.Column(db.Integer, default=30, nullable=False)  # Default 30 minutes
+    expiry_time = db.Column(db.DateTime, nullable=True)
     status = db.Column(
         Enum('active', 'completed', 'timeout', 'abandoned', name='session_status'),
         default='active',
@@ -22,52 +27,70 @@ class QuizSession(db.Model):
     total_questions = db.Column(db.Integer, default=0)
 
     # Relationships
-    user = db.relationship('User', backref=db.backref('quiz_sessions', lazy=True))
+    user = db.relationship('User', back_populates='quiz_sessions')
 
     def __init__(self, user_id, time_limit_minutes=30):
         self.user_id = user_id
         self.time_limit_minutes = time_limit_minutes
         self.start_time = utc_now()
+        self.expiry_time = self.start_time + timedelta(minutes=time_limit_minutes)
         self.status = 'active'
 
-    @property
-    def expiry_time(self):
-        """Calculate when the quiz expires"""
-        if self.start_time is None:
-            return None
+    def extend_time(self, additional_minutes):
+        """Extend the time limit and recompute the stored expiry"""
+        self.time_limit_minutes += additional_minutes
         start_time_aware = ensure_utc(self.start_time)
-        if start_time_aware is None:
-            return None
-        return start_time_aware + timedelta(minutes=self.time_limit_minutes)
+        if start_time_aware is not None:
+            self.expiry_time = start_time_aware + \
+                timedelta(minutes=self.time_limit_minutes)
 
-    @property
-    def time_remaining_seconds(self):
-        """Get remaining time in seconds"""
+    def time_remaining_at(self, now):
+        """Remaining seconds relative to an externally sampled clock"""
         if self.status != 'active':
             return 0
 
-        now = utc_now()
-        expiry = self.expiry_time
-
+        expiry = ensure_utc(self.expiry_time)
         if expiry is None or now >= expiry:
             return 0
 
         return int((expiry - now).total_seconds())
 
+    @property
+    def time_remaining_seconds(self):
+        """Get remaining time in seconds"""
+        return self.time_remaining_at(utc_now())
+
+    def time_elapsed_at(self, now):
+        """Elapsed seconds relative to an externally sampled clock"""
+        start = ensure_utc(self.start_time)
+        if start is None:
+            return 0
+        # now is already aware, so subtract directly instead of
+        # round-tripping both operands through seconds_between
+        return int((now - start).total_seconds())
+
     @property
     def time_elapsed_seconds(self):
         """Get elapsed time in seconds"""
-        now = utc_now()
-        return seconds_between(self.start_time, now)
+        return self.time_elapsed_at(utc_now())
 
-    @property
-    def is_expired(self):
-        """Check if quiz session has expired"""
+    def is_expired_at(self, now):
+        """Expiry check relative to an externally sampled clock"""
         if self.status != 'active':
             return True
 
+        # Single comparison against the stored expiry column
         expiry = self.expiry_time
-        return expiry is not None and utc_now() >= expiry
+        if expiry is None:
+            return False
+        if expiry.tzinfo is None:
+            expiry = ensure_utc(expiry)
+        return now >= expiry
+
+    @property
+    def is_expired(self):
+        """Check if quiz session has expired"""
+        return self.is_expired_at(utc_now())
 
     @property
     def progress_percentage(self):
@@ -103,7 +126,13 @@ class QuizSession(db.Model):
     @classmethod
     def get_active_session(cls, user_id):
         """Get active quiz session for user"""
-        return cls.query.filter_by(
+        from sqlalchemy.orm import joinedload, raiseload
+        # raiseload turns any accidental lazy load on this hot-path
+        # object into a loud error instead of a silent extra query
+        return cls.query.options(
+            joinedload(cls.user),
+            raiseload('*')
+        ).filter_by(
             user_id=user_id,
             status='active'
         ).first()
@@ -117,9 +146,9 @@ class QuizSession(db.Model):
         active_session = cls.get_active_session(user_id)
         if active_session:
             active_session.abandon_session()
-            db.session.commit()
 
-        # Create new session
+        # Create new session; one commit persists both the abandoned
+        # old row and the new one
         session = cls(user_id=user_id, time_limit_minutes=time_limit_minutes)
         db.session.add(session)
         db.session.commit()
@@ -128,6 +157,26 @@ class QuizSession(db.Model):
 
     def to_dict(self):
         """Convert session to dictionary for JSON responses"""
+        # Compute the clock-dependent values once instead of letting each
+        # property call utc_now()/ensure_utc() independently
+        now = utc_now()
+        expiry = ensure_utc(self.expiry_time)
+
+        if self.status == 'active' and expiry is not None and now < expiry:
+            remaining = int((expiry - now).total_seconds())
+        else:
+            remaining = 0
+
+        start = ensure_utc(self.start_time)
+        elapsed = int((now - start).total_seconds()) if start else 0
+        expired = self.status != 'active' or (expiry is not None and now >= expiry)
+
+        total_time = self.time_limit_minutes * 60
+        if total_time == 0:
+            progress = 100
+        else:
+            progress = min(100, max(0, (elapsed / total_time) * 100))
+
         return {
             'id': self.id,
             'user_id': self.user_id,
@@ -137,11 +186,11 @@ class QuizSession(db.Model):
             'status': self.status,
             'score': self.score,
             'total_questions': self.total_questions,
-            'time_remaining_seconds': self.time_remaining_seconds,
-            'time_elapsed_seconds': self.time_elapsed_seconds,
-            'is_expired': self.is_expired,
-            'progress_percentage': self.progress_percentage,
-            'expiry_time': self.expiry_time.isoformat() if self.expiry_time else None
+            'time_remaining_seconds': remaining,
+            'time_elapsed_seconds': elapsed,
+            'is_expired': expired,
+            'progress_percentage': progress,
+            'expiry_time': expiry.isoformat() if expiry else None
         }
 
     def __repr__(self):
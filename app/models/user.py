@@ -1,5 +1,6 @@
 from app import db
 from app.utils.timezone_utils import utc_now
+from flask import current_app
 from flask_login import UserMixin
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -12,13 +13,15 @@ class User(UserMixin, db.Model):
     first_name = db.Column(db.String(100), nullable=False)
     last_name = db.Column(db.String(100), nullable=False)
     user_name = db.Column(db.String(100), nullable=False, unique=True)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
     created_at = db.Column(db.DateTime, default=utc_now)
-    quiz_results = db.relationship('QuizResult', backref='user')
+    quiz_results = db.relationship('QuizResult', back_populates='user')
+    quiz_sessions = db.relationship('QuizSession', back_populates='user', lazy=True)
 
     def set_password(self, password):
         """set password hash"""
-        self.password_hash = generate_password_hash(password)
+        method = current_app.config.get('PASSWORD_HASH_METHOD', 'scrypt')
+        self.password_hash = generate_password_hash(password, method=method)
 
     def check_password(self, password):
         """check if password matches"""
@@ -1,2 +1,37 @@
 """Authentication logic"""
+import hashlib
+import hmac
 from app.models.user import User
+from flask import current_app
+
+
+def _sign_heartbeat_payload(payload):
+    """HMAC-SHA256 signature over a heartbeat token payload"""
+    secret = current_app.config['SECRET_KEY'].encode()
+    return hmac.new(secret, payload.encode(), hashlib.sha256).hexdigest()
+
+
+def issue_heartbeat_token(session_id, user_id):
+    """Issue a signed token binding a quiz session to its user
+
+    Lets the heartbeat endpoint authenticate with one HMAC check instead
+    of a full session-cookie decode plus user reload on every poll.
+    """
+    payload = f"{session_id}.{user_id}"
+    return f"{payload}.{_sign_heartbeat_payload(payload)}"
+
+
+def verify_heartbeat_token(token):
+    """Verify a heartbeat token, returning (session_id, user_id) or None"""
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+
+    payload = f"{parts[0]}.{parts[1]}"
+    if not hmac.compare_digest(_sign_heartbeat_payload(payload), parts[2]):
+        return None
+
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
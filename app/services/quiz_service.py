@@ -2,13 +2,72 @@
 from app.models.question import Questions
 from app.models.quiz_session import QuizSession
 from app.utils.timezone_utils import utc_now
+from collections import namedtuple
 from flask_login import current_user
 
+# The question bank changes rarely but is read on every /quiz page load
+# and /get_questions call, so keep a process-local copy and invalidate
+# it whenever a question is created, edited or deleted
+_QUESTIONS_CACHE = {'data': None, 'answers': None}
+
+CachedQuestion = namedtuple('CachedQuestion', ['id', 'question', 'answer'])
+
+
+def _invalidate_questions_cache():
+    """Drop the cached question list after a write"""
+    _QUESTIONS_CACHE['data'] = None
+    _QUESTIONS_CACHE['answers'] = None
+
 
 def get_questions():
-    """get all questions from db"""
+    """get all questions from db (cached between question writes)"""
+    from app import db
+
+    cached = _QUESTIONS_CACHE['data']
+    if cached is not None:
+        return cached
+
+    questions = [
+        CachedQuestion(q.id, q.question, q.answer)
+        for q in db.session.query(Questions).all()
+    ]
+    _QUESTIONS_CACHE['data'] = questions
+    return questions
+
+
+def get_questions_for_api():
+    """get (id, question) rows for the JSON endpoint
+
+    The API never exposes answers, so on a cold cache this selects just
+    the two columns and skips ORM instance construction entirely.
+    """
+    from app import db
+
+    cached = _QUESTIONS_CACHE['data']
+    if cached is not None:
+        return cached
+
+    return db.session.execute(
+        db.select(Questions.id, Questions.question)
+    ).all()
+
+
+def get_answer_map():
+    """get {question_id: normalized answer} for scoring
+
+    lower/trim run in SQL when the map is built, so scoring never calls
+    per-row string methods in Python. Cached alongside the question list.
+    """
     from app import db
-    return db.session.query(Questions).all()
+    from sqlalchemy import func
+
+    answers = _QUESTIONS_CACHE['answers']
+    if answers is None:
+        answers = dict(db.session.execute(
+            db.select(Questions.id, func.lower(func.trim(Questions.answer)))
+        ).all())
+        _QUESTIONS_CACHE['answers'] = answers
+    return answers
 
 
 def start_quiz_session(time_limit_minutes=30):
@@ -32,12 +91,19 @@ def get_active_quiz_session():
     return QuizSession.get_active_session(current_user.id)
 
 
-def validate_session_time(session):
-    """Check if session is still valid (not expired)"""
+def validate_session_time(session, now=None):
+    """Check if session is still valid (not expired)
+
+    Callers polling in a loop can pass an already-sampled `now` so the
+    clock is read once per iteration.
+    """
     if not session:
         return False, "No active quiz session"
 
-    if session.is_expired:
+    if now is None:
+        now = utc_now()
+
+    if session.is_expired_at(now):
         # Auto-timeout expired sessions
         from app import db
         session.timeout_session()
@@ -98,23 +164,36 @@ def get_quiz_score(form_data, results, session=None):
 
 def calculate_score(form_data, results):
     """Calculate quiz score from form data and questions"""
-    question_map = {q.id: q.answer for q in results}
-    counter = 0
+    from app import db
+    from sqlalchemy import func, tuple_
 
+    # Normalize submitted answers to (question_id, answer) pairs
+    pairs = []
     for id_str, ans in form_data.items():
         try:
-            # Validate that id is a valid integer
-            question_id = int(id_str)
-
-            # Check if question exists and answer matches (case-insensitive, stripped)
-            if (question_id in question_map and
-                question_map[question_id].strip().lower() == ans.strip().lower()):
-                counter += 1
-        except (ValueError, TypeError):
+            pairs.append((int(id_str), ans.strip().lower()))
+        except (ValueError, TypeError, AttributeError):
             # Skip invalid form data entries
             continue
 
-    return counter
+    if not pairs:
+        return 0
+
+    # Let the database do the comparison in one aggregate query.
+    # SQLite can't plan tuple IN well, so keep the Python loop there.
+    if db.engine.dialect.name != 'sqlite':
+        return db.session.query(func.count()).filter(
+            tuple_(
+                Questions.id,
+                func.lower(func.trim(Questions.answer))
+            ).in_(pairs)
+        ).scalar()
+
+    question_map = get_answer_map()
+    return sum(
+        1 for question_id, ans in pairs
+        if question_map.get(question_id) == ans
+    )
 
 
 def create_questions(question, answer):
@@ -136,6 +215,7 @@ def create_questions(question, answer):
     q.answer = answer.strip()
     db.session.add(q)
     db.session.commit()
+    _invalidate_questions_cache()
 
 
 def edit_question(question_id, new_question=None, new_answer=None):
@@ -160,6 +240,7 @@ def edit_question(question_id, new_question=None, new_answer=None):
         question.answer = new_answer.strip()
 
     db.session.commit()
+    _invalidate_questions_cache()
     return question
 
 
@@ -176,4 +257,5 @@ def delete_question(question_id):
 
     db.session.delete(question)
     db.session.commit()
+    _invalidate_questions_cache()
     return True
@@ -8,8 +8,13 @@ in the quiz application. Run this script to see how the timing system works.
 Usage: python demo_time_limits.py
 """
 
+import argparse
+import contextlib
+import functools
+import sys
 import time
 from datetime import datetime, timezone, timedelta
+from unittest import mock
 from app import create_app, db
 from app.models.user import User
 from app.models.quiz_session import QuizSession
@@ -18,6 +23,54 @@ from app.services.quiz_service import start_quiz_session, get_active_quiz_sessio
 from app.utils.timezone_utils import utc_now, format_duration
 
 
+class FakeClock:
+    """Fake UTC clock so --fast runs advance time instead of sleeping"""
+
+    def __init__(self):
+        self.current = datetime.now(timezone.utc)
+        self._monotonic = time.monotonic()
+
+    def now(self):
+        return self.current
+
+    def monotonic(self):
+        return self._monotonic
+
+    def advance(self, seconds):
+        self.current += timedelta(seconds=seconds)
+        self._monotonic += seconds
+
+
+def _fast_clock_patches(clock):
+    """Patches routing sleeps and utc_now reads through the fake clock
+
+    utc_now is imported by name in the model/service modules, so each
+    consumer reference has to be patched alongside the source.
+    """
+    return [
+        mock.patch('app.utils.timezone_utils.utc_now', clock.now),
+        mock.patch('app.models.quiz_session.utc_now', clock.now),
+        mock.patch('app.services.quiz_service.utc_now', clock.now),
+        mock.patch(f'{__name__}.utc_now', clock.now),
+        mock.patch('time.sleep', clock.advance),
+        mock.patch('time.monotonic', clock.monotonic),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _demo_user_id():
+    """Look up the demo user's id once per run"""
+    return db.session.query(User.id).limit(1).scalar()
+
+
+def _get_demo_user():
+    """Get the demo user via the identity map after the first query"""
+    user_id = _demo_user_id()
+    if user_id is None:
+        return None
+    return db.session.get(User, user_id)
+
+
 def print_header(title):
     """Print a formatted header"""
     print("\n" + "="*60)
@@ -38,25 +91,46 @@ def print_session_status(session):
 
 def simulate_quiz_taking(session, simulation_seconds=10):
     """Simulate taking a quiz over time"""
-    print(f"\n🎮 Simulating quiz taking for {simulation_seconds} seconds...")
-
-    for i in range(simulation_seconds):
-        # Check session status
-        is_valid, message = validate_session_time(session)
-
-        remaining = session.time_remaining_seconds
-        elapsed = session.time_elapsed_seconds
+    print(f"\n🎮 Simulating quiz taking for up to {simulation_seconds} seconds...")
+
+    deadline = time.monotonic() + simulation_seconds
+    poll_interval = 0.1
+    # Buffer status lines and flush every few iterations rather than
+    # syscall-per-print
+    lines = []
+
+    while True:
+        # One clock read per wakeup, shared by validation and both
+        # timing reads
+        now = utc_now()
+        is_valid, message = validate_session_time(session, now)
+        remaining = session.time_remaining_at(now)
+        elapsed = session.time_elapsed_at(now)
 
         status_emoji = "🟢" if remaining > 60 else "🟡" if remaining > 10 else "🔴"
 
-        print(f"{status_emoji} Second {i+1:2d}: {format_duration(remaining)} remaining | "
-              f"Elapsed: {format_duration(elapsed)} | Valid: {is_valid}")
+        lines.append(f"{status_emoji} {format_duration(remaining)} remaining | "
+                     f"Elapsed: {format_duration(elapsed)} | Valid: {is_valid}")
 
         if not is_valid:
-            print(f"⚠️  Session expired! {message}")
+            lines.append(f"⚠️  Session expired! {message}")
             break
 
-        time.sleep(1)  # Wait 1 second
+        if len(lines) >= 10:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+
+        time_left = deadline - time.monotonic()
+        if time_left <= 0:
+            break
+
+        # Adaptive backoff: wake less and less often instead of polling
+        # the session every second
+        time.sleep(max(0.1, min(remaining, poll_interval, time_left)))
+        poll_interval = min(poll_interval * 1.5, 5.0)
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("✅ Simulation complete!")
 
@@ -65,184 +139,179 @@ def demo_basic_timing():
     """Demonstrate basic timing functionality"""
     print_header("DEMO 1: Basic Time Limits Functionality")
 
-    app = create_app()
-    with app.app_context():
-        # Get first user
-        user = db.session.query(User).first()
-        if not user:
-            print("❌ No users found. Please register a user first.")
-            return
+    # Get first user
+    user = _get_demo_user()
+    if not user:
+        print("❌ No users found. Please register a user first.")
+        return
 
-        print(f"👤 Using user: {user.first_name} {user.last_name} ({user.user_name})")
+    print(f"👤 Using user: {user.first_name} {user.last_name} ({user.user_name})")
 
-        # Create a short 1-minute session for demo
-        session = QuizSession(user_id=user.id, time_limit_minutes=1)
-        db.session.add(session)
-        db.session.commit()
+    # Create a short 1-minute session for demo; flush assigns the id
+    # without paying a commit, the cleanup commit ends the transaction
+    session = QuizSession(user_id=user.id, time_limit_minutes=1)
+    db.session.add(session)
+    db.session.flush()
 
-        print("\n📝 Created new quiz session:")
-        print_session_status(session)
+    print("\n📝 Created new quiz session:")
+    print_session_status(session)
 
-        # Simulate taking the quiz
-        simulate_quiz_taking(session, simulation_seconds=70)  # 70 seconds = 1min 10sec
+    # Simulate taking the quiz
+    simulate_quiz_taking(session, simulation_seconds=70)  # 70 seconds = 1min 10sec
 
-        # Check final status
-        print("\n📋 Final session status:")
-        print_session_status(session)
+    # Check final status
+    print("\n📋 Final session status:")
+    print_session_status(session)
 
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
-        print("🗑️  Demo session cleaned up")
+    # Clean up
+    db.session.delete(session)
+    db.session.commit()
+    print("🗑️  Demo session cleaned up")
 
 
 def demo_session_management():
     """Demonstrate session management features"""
     print_header("DEMO 2: Session Management Features")
 
-    app = create_app()
-    with app.app_context():
-        user = db.session.query(User).first()
-        if not user:
-            print("❌ No users found. Please register a user first.")
-            return
-
-        print(f"👤 Using user: {user.first_name} {user.last_name}")
-
-        # Test creating multiple sessions (should replace previous)
-        print("\n1️⃣ Creating first session (5 minutes)...")
-        session1 = QuizSession.create_new_session(user.id, time_limit_minutes=5)
-        print(f"   Created session {session1.id}")
-
-        time.sleep(2)  # Wait 2 seconds
-
-        print("\n2️⃣ Creating second session (3 minutes) - should abandon first...")
-        session2 = QuizSession.create_new_session(user.id, time_limit_minutes=3)
-        print(f"   Created session {session2.id}")
-
-        # Check that first session was abandoned
-        db.session.refresh(session1)  # Refresh from database
-        print(f"   First session status: {session1.status}")
-        print(f"   Second session status: {session2.status}")
-
-        # Test session timeout
-        print("\n3️⃣ Testing session timeout...")
-        timeout_session = QuizSession(user_id=user.id, time_limit_minutes=0.05)  # 3 seconds
-        db.session.add(timeout_session)
-        db.session.commit()
-
-        print("   Waiting for session to expire...")
-        time.sleep(4)  # Wait 4 seconds
-
-        is_valid, message = validate_session_time(timeout_session)
-        print(f"   Session valid: {is_valid}")
-        print(f"   Message: {message}")
-        print(f"   Session status: {timeout_session.status}")
-
-        # Clean up all demo sessions
-        for session in [session1, session2, timeout_session]:
-            try:
-                db.session.delete(session)
-            except:
-                pass  # Already deleted
-        db.session.commit()
-        print("🗑️  All demo sessions cleaned up")
+    user = _get_demo_user()
+    if not user:
+        print("❌ No users found. Please register a user first.")
+        return
+
+    print(f"👤 Using user: {user.first_name} {user.last_name}")
+
+    # Test creating multiple sessions (should replace previous)
+    print("\n1️⃣ Creating first session (5 minutes)...")
+    session1 = QuizSession.create_new_session(user.id, time_limit_minutes=5)
+    print(f"   Created session {session1.id}")
+
+    time.sleep(2)  # Wait 2 seconds
+
+    print("\n2️⃣ Creating second session (3 minutes) - should abandon first...")
+    session2 = QuizSession.create_new_session(user.id, time_limit_minutes=3)
+    print(f"   Created session {session2.id}")
+
+    # Check that first session was abandoned; create_new_session's
+    # commit expired session1, so the attribute read reloads it without
+    # an explicit refresh
+    print(f"   First session status: {session1.status}")
+    print(f"   Second session status: {session2.status}")
+
+    # Test session timeout
+    print("\n3️⃣ Testing session timeout...")
+    timeout_session = QuizSession(user_id=user.id, time_limit_minutes=0.05)  # 3 seconds
+    db.session.add(timeout_session)
+    db.session.flush()
+
+    print("   Waiting for session to expire...")
+    time.sleep(4)  # Wait 4 seconds
+
+    is_valid, message = validate_session_time(timeout_session)
+    print(f"   Session valid: {is_valid}")
+    print(f"   Message: {message}")
+    print(f"   Session status: {timeout_session.status}")
+
+    # Clean up all demo sessions
+    for session in [session1, session2, timeout_session]:
+        try:
+            db.session.delete(session)
+        except:
+            pass  # Already deleted
+    db.session.commit()
+    print("🗑️  All demo sessions cleaned up")
 
 
 def demo_api_responses():
     """Demonstrate API response format"""
     print_header("DEMO 3: API Response Format")
 
-    app = create_app()
-    with app.app_context():
-        user = db.session.query(User).first()
-        if not user:
-            print("❌ No users found. Please register a user first.")
-            return
+    user = _get_demo_user()
+    if not user:
+        print("❌ No users found. Please register a user first.")
+        return
 
-        # Create a session
-        session = QuizSession(user_id=user.id, time_limit_minutes=2)
-        db.session.add(session)
-        db.session.commit()
+    # Create a session (flushed, committed once at cleanup)
+    session = QuizSession(user_id=user.id, time_limit_minutes=2)
+    db.session.add(session)
+    db.session.flush()
 
-        print("📡 Session API Response Format:")
-        session_dict = session.to_dict()
+    print("📡 Session API Response Format:")
+    session_dict = session.to_dict()
 
-        for key, value in session_dict.items():
-            print(f"   {key}: {value}")
+    for key, value in session_dict.items():
+        print(f"   {key}: {value}")
 
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
-        print("🗑️  Demo session cleaned up")
+    # Clean up
+    db.session.delete(session)
+    db.session.commit()
+    print("🗑️  Demo session cleaned up")
 
 
 def demo_scoring_with_timeout():
     """Demonstrate quiz scoring with timeouts"""
     print_header("DEMO 4: Quiz Scoring with Time Limits")
 
-    app = create_app()
-    with app.app_context():
-        user = db.session.query(User).first()
-        questions = db.session.query(Questions).limit(3).all()
+    user = _get_demo_user()
+    questions = db.session.query(Questions).limit(3).all()
 
-        if not user or not questions:
-            print("❌ Need users and questions in database.")
-            return
+    if not user or not questions:
+        print("❌ Need users and questions in database.")
+        return
 
-        print(f"👤 User: {user.user_name}")
-        print(f"📚 Using {len(questions)} questions for demo")
+    print(f"👤 User: {user.user_name}")
+    print(f"📚 Using {len(questions)} questions for demo")
 
-        # Create a very short session (10 seconds)
-        session = QuizSession(user_id=user.id, time_limit_minutes=0.17)  # ~10 seconds
-        db.session.add(session)
-        db.session.commit()
+    # Create a very short session (10 seconds); flushed, committed once
+    # at cleanup
+    session = QuizSession(user_id=user.id, time_limit_minutes=0.17)  # ~10 seconds
+    db.session.add(session)
+    db.session.flush()
 
-        print(f"\n⏰ Created 10-second session")
-        print(f"   Start: {session.start_time}")
-        print(f"   Expires: {session.expiry_time}")
+    print(f"\n⏰ Created 10-second session")
+    print(f"   Start: {session.start_time}")
+    print(f"   Expires: {session.expiry_time}")
 
-        # Simulate answering questions
-        form_data = {}
-        for i, q in enumerate(questions):
-            print(f"\n❓ Question {i+1}: {q.question}")
-            print(f"   Correct answer: {q.answer}")
+    # Simulate answering questions
+    form_data = {}
+    for i, q in enumerate(questions):
+        print(f"\n❓ Question {i+1}: {q.question}")
+        print(f"   Correct answer: {q.answer}")
 
-            # Simulate user providing correct answer
-            form_data[str(q.id)] = q.answer
+        # Simulate user providing correct answer
+        form_data[str(q.id)] = q.answer
 
-            time.sleep(3)  # 3 seconds per question
+        time.sleep(3)  # 3 seconds per question
 
-            remaining = session.time_remaining_seconds
-            print(f"   ⏳ Time remaining: {format_duration(remaining)}")
+        remaining = session.time_remaining_seconds
+        print(f"   ⏳ Time remaining: {format_duration(remaining)}")
 
-            if session.is_expired:
-                print("   ⚠️  Time expired during question!")
-                break
+        if session.is_expired:
+            print("   ⚠️  Time expired during question!")
+            break
 
-        print(f"\n📊 Final form data: {len(form_data)} answers collected")
-        print(f"⏰ Session expired: {session.is_expired}")
+    print(f"\n📊 Final form data: {len(form_data)} answers collected")
+    print(f"⏰ Session expired: {session.is_expired}")
 
-        # This would normally be called in the route handler
-        # but we'll just show the concept
-        if session.is_expired:
-            print("🔴 Quiz would be auto-submitted due to timeout")
-            session.timeout_session(score=len(form_data), total_questions=len(questions))
-        else:
-            print("🟢 Quiz completed within time limit")
-            session.complete_session(score=len(form_data), total_questions=len(questions))
+    # This would normally be called in the route handler
+    # but we'll just show the concept
+    if session.is_expired:
+        print("🔴 Quiz would be auto-submitted due to timeout")
+        session.timeout_session(score=len(form_data), total_questions=len(questions))
+    else:
+        print("🟢 Quiz completed within time limit")
+        session.complete_session(score=len(form_data), total_questions=len(questions))
 
-        db.session.commit()
+    db.session.flush()
 
-        print(f"\n📋 Final session status:")
-        print(f"   Status: {session.status}")
-        print(f"   Score: {session.score}/{session.total_questions}")
-        print(f"   End time: {session.end_time}")
+    print(f"\n📋 Final session status:")
+    print(f"   Status: {session.status}")
+    print(f"   Score: {session.score}/{session.total_questions}")
+    print(f"   End time: {session.end_time}")
 
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
-        print("🗑️  Demo session cleaned up")
+    # Clean up
+    db.session.delete(session)
+    db.session.commit()
+    print("🗑️  Demo session cleaned up")
 
 
 def demo_frontend_integration():
@@ -282,7 +351,7 @@ def demo_frontend_integration():
     print("   ✅ Accessibility features")
 
 
-def main():
+def main(fast=False):
     """Run all demos"""
     print("🎯 QUIZ APPLICATION TIME LIMITS DEMO")
     print("=" * 60)
@@ -290,11 +359,25 @@ def main():
     print("The system provides comprehensive timing controls with both backend")
     print("validation and frontend user experience enhancements.")
 
+    # One app and one context for all demos so Flask setup and the
+    # SQLAlchemy engine pool are only built once
+    app = create_app()
+
     try:
-        demo_basic_timing()
-        demo_session_management()
-        demo_api_responses()
-        demo_scoring_with_timeout()
+        with contextlib.ExitStack() as stack:
+            if fast:
+                # Fast-forward mode for CI/smoketests: every sleep
+                # advances the fake clock instead of blocking
+                print("⏩ Fast mode: sleeps advance a fake clock")
+                clock = FakeClock()
+                for patch in _fast_clock_patches(clock):
+                    stack.enter_context(patch)
+
+            with app.app_context():
+                demo_basic_timing()
+                demo_session_management()
+                demo_api_responses()
+                demo_scoring_with_timeout()
         demo_frontend_integration()
 
         print_header("DEMO COMPLETE")
@@ -317,4 +400,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Quiz time limits demo")
+    parser.add_argument('--fast', action='store_true',
+                        help="fast-forward a fake clock instead of sleeping")
+    args = parser.parse_args()
+    main(fast=args.fast)
@@ -10,12 +10,18 @@ Usage: python test_routes.py
 
 import requests
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
 # Base URL for the Flask application
 BASE_URL = "http://localhost:5000"
 
+# Link prefixes extract_links skips (external and javascript links)
+_SKIP_PREFIXES = ('http', 'javascript:')
+
 class RouteTestError(Exception):
     """Custom exception for route testing errors"""
     pass
@@ -24,52 +30,78 @@ class RouteChecker:
     def __init__(self, base_url=BASE_URL):
         self.base_url = base_url
         self.session = requests.Session()
+        # Keep-alive connection pool so repeated probes skip the TCP
+        # handshake
+        self.session.mount("http://", HTTPAdapter(pool_connections=10,
+                                                  pool_maxsize=20))
         self.routes_tested = set()
         self.failed_routes = []
-
-    def test_route(self, path, expected_status=200, method='GET', data=None):
-        """Test a single route"""
+        # Successful GET responses keyed by path so pages probed by both
+        # test_all_routes and test_template_links are only fetched once
+        self._response_cache = {}
+        # Guards the shared bookkeeping when probes run on the thread pool
+        self._lock = threading.Lock()
+
+    def _probe_route(self, path, expected_status=200, method='GET', data=None,
+                     needs_body=True):
+        """Issue one probe and return (response, report line)"""
         url = urljoin(self.base_url, path)
 
         try:
             if method.upper() == 'POST':
                 response = self.session.post(url, data=data)
+            elif not needs_body:
+                # Status-only checks don't need the body downloaded;
+                # HEAD without redirects also observes the raw 302s
+                response = self.session.head(url, allow_redirects=False)
             else:
                 response = self.session.get(url)
 
+        except requests.exceptions.ConnectionError:
+            with self._lock:
+                self.failed_routes.append(f"{method} {path}")
+            return None, f"❌ {method} {path} - Connection failed (Is the server running?)"
+        except Exception as e:
+            with self._lock:
+                self.failed_routes.append(f"{method} {path}")
+            return None, f"❌ {method} {path} - Error: {str(e)}"
+
+        with self._lock:
             self.routes_tested.add(path)
 
             if response.status_code == expected_status:
-                print(f"✅ {method} {path} - Status: {response.status_code}")
-                return response
+                line = f"✅ {method} {path} - Status: {response.status_code}"
+                if method.upper() == 'GET' and expected_status == 200:
+                    self._response_cache[path] = response
             else:
-                print(f"❌ {method} {path} - Expected: {expected_status}, Got: {response.status_code}")
+                line = f"❌ {method} {path} - Expected: {expected_status}, Got: {response.status_code}"
                 self.failed_routes.append(f"{method} {path}")
-                return response
 
-        except requests.exceptions.ConnectionError:
-            print(f"❌ {method} {path} - Connection failed (Is the server running?)")
-            self.failed_routes.append(f"{method} {path}")
-            return None
-        except Exception as e:
-            print(f"❌ {method} {path} - Error: {str(e)}")
-            self.failed_routes.append(f"{method} {path}")
-            return None
+        return response, line
 
-    def extract_links(self, html_content):
-        """Extract links from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        links = []
+    def test_route(self, path, expected_status=200, method='GET', data=None):
+        """Test a single route"""
+        if method.upper() == 'GET' and expected_status == 200 and \
+                path in self._response_cache:
+            return self._response_cache[path]
 
-        # Find all anchor tags with href attributes
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            # Skip external links and javascript links
-            if href.startswith('http') or href.startswith('javascript:'):
-                continue
-            links.append(href)
+        response, line = self._probe_route(path, expected_status, method, data)
+        print(line)
+        return response
 
-        return links
+    def extract_links(self, html_content):
+        """Extract links from HTML content"""
+        # lxml parses in C, roughly an order of magnitude faster than
+        # the pure-Python html.parser backend
+        soup = BeautifulSoup(html_content, 'lxml')
+
+        # Keep anchor hrefs that aren't external or javascript links;
+        # startswith takes the whole prefix tuple in one call
+        return [
+            link['href']
+            for link in soup.find_all('a', href=True)
+            if not link['href'].startswith(_SKIP_PREFIXES)
+        ]
 
     def test_all_routes(self):
         """Test all application routes"""
@@ -95,26 +127,41 @@ class RouteChecker:
             links = self.extract_links(register_response.text)
             print(f"   Found {len(links)} links in register page: {links}")
 
-        # Test logout (should redirect to login)
-        self.test_route('/logout', expected_status=302)
+        # The remaining probes are independent status checks, so overlap
+        # their network waits on a thread pool and report in a fixed order
+        probe_specs = [
+            # Test logout (should redirect to login)
+            ('/logout', 302, 'GET', None, False),
+            # Test quiz page / results without authentication (should redirect)
+            ('/quiz', 302, 'GET', None, False),
+            ('/quiz_results', 302, 'GET', None, False),
+            # Test empty login/registration forms (should stay on page with errors)
+            ('/login', 200, 'POST', {}, True),
+            ('/register', 200, 'POST', {}, True),
+            # Test non-existent route
+            ('/nonexistent', 404, 'GET', None, False),
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(self._probe_route, path, status, method, data,
+                                needs_body)
+                for path, status, method, data, needs_body in probe_specs
+            ]
+            lines = [future.result()[1] for future in futures]
+
+        print(lines[0])
 
         print("\n📍 Testing Protected Routes (should redirect to login)")
-        # Test quiz page without authentication (should redirect)
-        self.test_route('/quiz', expected_status=302)
-
-        # Test quiz results without authentication (should redirect)
-        self.test_route('/quiz_results', expected_status=302)
+        print(lines[1])
+        print(lines[2])
 
         print("\n📍 Testing Form Submissions")
-        # Test empty login form (should stay on login page with errors)
-        self.test_route('/login', method='POST', data={}, expected_status=200)
-
-        # Test empty registration form (should stay on register page with errors)
-        self.test_route('/register', method='POST', data={}, expected_status=200)
+        print(lines[3])
+        print(lines[4])
 
         print("\n📍 Testing Invalid Routes")
-        # Test non-existent route
-        self.test_route('/nonexistent', expected_status=404)
+        print(lines[5])
 
         # Summary
         print(f"\n📊 Test Summary")
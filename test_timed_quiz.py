@@ -5,11 +5,11 @@ Timed Quiz Test Script
 This script tests the complete timed quiz functionality to ensure
 everything works correctly after fixing the CSRF token error.
 
-Usage: python test_timed_quiz.py
+Usage: pytest -n auto test_timed_quiz.py
 """
 
-import sys
-import time
+import logging
+import pytest
 from datetime import datetime, timedelta
 from app import create_app, db
 from app.models.user import User
@@ -22,363 +22,350 @@ from app.services.quiz_service import (
     calculate_score
 )
 from app.utils.timezone_utils import utc_now
-
-
-def test_session_creation():
-    """Test creating a new quiz session"""
-    print("\n🧪 Testing Session Creation...")
-
-    app = create_app()
+from collections import namedtuple
+from functools import lru_cache
+from sqlalchemy import select
+from sqlalchemy.pool import StaticPool
+
+# Diagnostic output goes through logging instead of print: with the
+# level off the %s-style calls cost next to nothing, and pytest's
+# --log-cli-level=DEBUG surfaces them again when needed
+logger = logging.getLogger(__name__)
+
+SeedBaseline = namedtuple('SeedBaseline', ['user_id', 'question_ids'])
+
+# Deterministic rows every test can rely on, inserted once per run
+_BASELINE_QUESTIONS = [
+    ('What does HTTP stand for in web addresses?',
+     'hypertext transfer protocol'),
+    ('Which language is Flask written in?', 'python'),
+    ('What SQL keyword retrieves rows from a table?', 'select'),
+    ('What does CSS stand for?', 'cascading style sheets'),
+    ('Which HTTP status code means Not Found?', '404'),
+    ('What data structure uses first-in first-out order?', 'queue'),
+    ('Which command stages changes in git?', 'add'),
+    ('What does API stand for?', 'application programming interface'),
+    ('Which protocol secures HTTP traffic?', 'tls'),
+    ('What does DNS resolve names into?', 'ip addresses'),
+]
+
+# The suite runs against a private in-memory database instead of the
+# configured one; StaticPool keeps a single live connection so every
+# test and the app itself see the same :memory: store
+_TEST_CONFIG = {
+    'TESTING': True,
+    'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+    'SQLALCHEMY_ENGINE_OPTIONS': {
+        'poolclass': StaticPool,
+        # The single in-memory connection can't go stale, so skip the
+        # SELECT 1 validation ping the app config enables on checkout
+        'pool_pre_ping': False,
+        'connect_args': {'check_same_thread': False},
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _build_test_app():
+    """Construct the test app at most once per process
+
+    config_overrides is a dict and unhashable, so the memoization keys
+    on this zero-argument wrapper rather than create_app itself. Any
+    stray direct call during refactoring gets the fixture's app back
+    instead of paying for a second construction.
+    """
+    return create_app(config_overrides=_TEST_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Build the Flask app once for the whole suite"""
+    app = _build_test_app()
+
+    # Fresh :memory: store: create the schema once for the whole run
     with app.app_context():
-        user = User.query.first()
-        if not user:
-            print("❌ No users found for testing")
-            return False
-
-        # Create a test session
-        session = QuizSession(user_id=user.id, time_limit_minutes=5)
-        db.session.add(session)
-        db.session.commit()
+        db.create_all()
 
-        print(f"✅ Session created: ID {session.id}")
-        print(f"   User: {user.first_name} {user.last_name}")
-        print(f"   Time limit: {session.time_limit_minutes} minutes")
-        print(f"   Start time: {session.start_time}")
-        print(f"   Expiry time: {session.expiry_time}")
-        print(f"   Time remaining: {session.time_remaining_seconds} seconds")
-        print(f"   Is expired: {session.is_expired}")
+    return app
 
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
-
-        return True
 
+@pytest.fixture(scope="session")
+def seed_baseline(app):
+    """Insert the deterministic baseline rows once per run
 
-def test_timing_calculations():
-    """Test timing calculations and properties"""
-    print("\n🧪 Testing Timing Calculations...")
-
-    app = create_app()
+    The single commit here is outside every per-test transaction, so
+    rollbacks never touch these rows and all tests can rely on the
+    returned IDs.
+    """
     with app.app_context():
-        user = User.query.first()
-        if not user:
-            print("❌ No users found for testing")
-            return False
-
-        # Create session with 2-minute limit for testing
-        session = QuizSession(user_id=user.id, time_limit_minutes=2)
-        db.session.add(session)
+        user = User(first_name='Test', last_name='User',
+                    user_name='timed_quiz_tester')
+        user.set_password('test-password')
+        questions = [
+            Questions(question=question, answer=answer)
+            for question, answer in _BASELINE_QUESTIONS
+        ]
+        db.session.add(user)
+        db.session.add_all(questions)
         db.session.commit()
 
-        print(f"✅ Created 2-minute test session")
-        print(f"   Time remaining: {session.time_remaining_seconds} seconds")
-        print(f"   Expected: ~120 seconds")
-
-        # Test that calculations work
-        expected_remaining = session.time_limit_minutes * 60
-        actual_remaining = session.time_remaining_seconds
+        return SeedBaseline(user.id, [q.id for q in questions])
 
-        # Allow for small timing differences (within 5 seconds)
-        if abs(expected_remaining - actual_remaining) <= 5:
-            print("✅ Timing calculations are accurate")
-        else:
-            print(f"❌ Timing mismatch: expected ~{expected_remaining}, got {actual_remaining}")
-            return False
 
-        # Test progress percentage
-        progress = session.progress_percentage
-        print(f"   Progress: {progress:.2f}% (should be very low)")
-
-        # Test elapsed time
-        elapsed = session.time_elapsed_seconds
-        print(f"   Elapsed: {elapsed} seconds (should be very low)")
-
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
-
-        return True
-
-
-def test_session_expiration():
-    """Test session expiration handling"""
-    print("\n🧪 Testing Session Expiration...")
-
-    app = create_app()
+@pytest.fixture(scope="session")
+def app_context(app):
+    """Enter a single application context shared by all tests"""
     with app.app_context():
-        user = User.query.first()
-        if not user:
-            print("❌ No users found for testing")
-            return False
-
-        # Create a session that expires in 3 seconds
-        session = QuizSession(user_id=user.id, time_limit_minutes=0.05)  # 3 seconds
-        db.session.add(session)
-        db.session.commit()
+        yield app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Shared test client for the HTTP-level tests"""
+    return app.test_client()
+
+
+@pytest.fixture
+def db_session(app_context):
+    """Run each test inside a connection-level transaction, then roll back
+
+    In-test commit() calls only release a savepoint (SQLAlchemy's
+    create_savepoint join mode), so the rollback below undoes every row
+    the test wrote and no cleanup code is needed.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    session = db._make_scoped_session(
+        {'bind': connection, 'join_transaction_mode': 'create_savepoint'}
+    )
+    previous_session = db.session
+    db.session = session
+    try:
+        yield session
+    finally:
+        db.session = previous_session
+        session.remove()
+        transaction.rollback()
+        connection.close()
 
-        print(f"✅ Created 3-second test session")
-        print(f"   Initially expired: {session.is_expired}")
-        print("   Waiting 4 seconds for expiration...")
 
-        # Wait for session to expire
-        time.sleep(4)
+@pytest.fixture(scope="session")
+def require_seed_data(app_context, seed_baseline):
+    """Skip the suite once, up front, if the seed rows went missing
 
-        # Refresh from database and check expiration
-        db.session.refresh(session)
-        is_expired = session.is_expired
-        print(f"   After 4 seconds - expired: {is_expired}")
+    Both counts travel in a single SELECT via scalar subqueries,
+    replacing the per-test existence guards.
+    """
+    from sqlalchemy import func
 
-        # Test validation function
-        is_valid, message = validate_session_time(session)
-        print(f"   Validation result: valid={is_valid}, message='{message}'")
+    user_count, question_count = db.session.execute(
+        select(
+            select(func.count()).select_from(User).scalar_subquery(),
+            select(func.count()).select_from(Questions).scalar_subquery(),
+        )
+    ).one()
 
-        # Check that session was automatically timed out
-        db.session.refresh(session)
-        print(f"   Final status: {session.status}")
+    if not user_count or not question_count:
+        pytest.skip("No seed data (need at least one user and one question)")
 
-        if is_expired and not is_valid and session.status in ['timeout', 'active']:
-            print("✅ Session expiration working correctly")
-        else:
-            print("❌ Session expiration not working as expected")
-            return False
 
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
+@pytest.fixture(scope="session")
+def sample_user_id(require_seed_data, seed_baseline):
+    """The baseline user's ID, no lookup query needed"""
+    return seed_baseline.user_id
 
-        return True
 
+@pytest.fixture(scope="session")
+def sample_question_ids(require_seed_data, seed_baseline):
+    """Three baseline question IDs, no lookup query needed"""
+    return list(seed_baseline.question_ids[:3])
 
-def test_quiz_scoring():
-    """Test quiz scoring with session integration"""
-    print("\n🧪 Testing Quiz Scoring Integration...")
 
-    app = create_app()
-    with app.app_context():
-        user = User.query.first()
-        questions = Questions.query.limit(3).all()
+@pytest.fixture
+def sample_user(db_session, sample_user_id):
+    """The shared test user, attached to this test's transaction
 
-        if not user or not questions:
-            print("❌ Need user and questions for scoring test")
-            return False
+    Fetching by primary key through db.session.get hits the identity
+    map, so re-attaching costs at most one SELECT per test.
+    """
+    return db.session.get(User, sample_user_id)
 
-        print(f"✅ Testing with {len(questions)} questions")
 
-        # Create session
-        session = QuizSession(user_id=user.id, time_limit_minutes=10)
-        db.session.add(session)
-        db.session.commit()
+@pytest.fixture
+def sample_questions(db_session, sample_question_ids):
+    """The shared test questions, attached to this test's transaction"""
+    return [db.session.get(Questions, qid) for qid in sample_question_ids]
 
-        # Create form data with correct answers
-        form_data = {}
-        for q in questions:
-            form_data[str(q.id)] = q.answer
-            print(f"   Q{q.id}: {q.question[:50]}... = '{q.answer}'")
 
-        # Test scoring calculation
-        score = calculate_score(form_data, questions)
-        expected_score = len(questions)
+def test_session_creation(db_session, sample_user):
+    """Test creating a new quiz session"""
+    user = sample_user
 
-        print(f"   Calculated score: {score}/{len(questions)}")
-        print(f"   Expected score: {expected_score}/{len(questions)}")
+    # Create a test session
+    session = QuizSession(user_id=user.id, time_limit_minutes=5)
+    # flush assigns the ID without ending the transaction
+    db.session.add(session)
+    db.session.flush()
 
-        if score == expected_score:
-            print("✅ Quiz scoring working correctly")
-        else:
-            print("❌ Quiz scoring not working as expected")
-            return False
+    # Sample the clock-dependent properties once; each access calls
+    # utc_now() and does fresh datetime arithmetic
+    remaining = session.time_remaining_seconds
+    expired = session.is_expired
 
-        # Test session completion
-        session.complete_session(score=score, total_questions=len(questions))
-        db.session.commit()
+    logger.debug("Session created: ID %s", session.id)
+    logger.debug("User: %s %s", user.first_name, user.last_name)
+    logger.debug("Time limit: %s minutes", session.time_limit_minutes)
+    logger.debug("Start time: %s", session.start_time)
+    logger.debug("Time remaining: %s seconds", remaining)
+    logger.debug("Is expired: %s", expired)
 
-        print(f"   Session completed with status: {session.status}")
-        print(f"   Final score: {session.score}/{session.total_questions}")
+    assert remaining > 0
+    assert not expired
 
-        # Clean up
-        db.session.delete(session)
-        db.session.commit()
 
-        return True
+def test_timing_calculations(db_session, sample_user):
+    """Test timing calculations and properties"""
+    user = sample_user
 
+    # Create session with 2-minute limit for testing
+    session = QuizSession(user_id=user.id, time_limit_minutes=2)
+    # flush assigns the ID without ending the transaction
+    db.session.add(session)
+    db.session.flush()
 
-def test_web_interface():
-    """Test the web interface routes"""
-    print("\n🧪 Testing Web Interface...")
+    # One sample per property: repeated accesses each read utc_now(),
+    # and comparing two different samples invites timing skew
+    actual_remaining = session.time_remaining_seconds
 
-    app = create_app()
-    with app.test_client() as client:
-        with app.app_context():
-            # Test home page
-            response = client.get('/')
-            print(f"✅ Home page: {response.status_code}")
+    logger.debug("Created 2-minute test session")
+    logger.debug("Time remaining: %s seconds (expected ~120)",
+                 actual_remaining)
 
-            # Test login page
-            response = client.get('/login')
-            print(f"✅ Login page: {response.status_code}")
+    # Test that calculations work
+    expected_remaining = session.time_limit_minutes * 60
 
-            # Test quiz page (should redirect to login)
-            response = client.get('/quiz')
-            print(f"✅ Quiz page (no auth): {response.status_code} (should be 302)")
+    # Allow for small timing differences (within 5 seconds)
+    assert abs(expected_remaining - actual_remaining) <= 5, \
+        f"Timing mismatch: expected ~{expected_remaining}, got {actual_remaining}"
 
-            # Test quiz status API (should redirect to login)
-            response = client.get('/quiz_status')
-            print(f"✅ Quiz status API (no auth): {response.status_code} (should be 302)")
+    # Test progress percentage
+    progress = session.progress_percentage
+    logger.debug("Progress: %.2f%% (should be very low)", progress)
 
-            # Test abandon route (should redirect to login)
-            response = client.post('/quiz/abandon')
-            print(f"✅ Abandon quiz (no auth): {response.status_code} (should be 302)")
+    # Test elapsed time
+    elapsed = session.time_elapsed_seconds
+    logger.debug("Elapsed: %s seconds (should be very low)", elapsed)
 
-            return True
 
+def test_session_expiration(db_session, sample_user):
+    """Test session expiration handling"""
+    user = sample_user
 
-def test_api_endpoints():
-    """Test API endpoint responses"""
-    print("\n🧪 Testing API Endpoints...")
+    # Create a 3-second session already past its expiry: backdating the
+    # start beats sleeping through it in real time
+    session = QuizSession(user_id=user.id, time_limit_minutes=0.05)  # 3 seconds
+    session.start_time = utc_now() - timedelta(seconds=10)
+    session.expiry_time = session.start_time + \
+        timedelta(minutes=session.time_limit_minutes)
+    # flush assigns the ID without ending the transaction
+    db.session.add(session)
+    db.session.flush()
 
-    app = create_app()
-    with app.test_client() as client:
-        with app.app_context():
-            # Test session status API (unauthenticated)
-            response = client.get('/session/status')
-            print(f"✅ Session status API: {response.status_code} (should be 302 - redirect to login)")
+    logger.debug("Created 3-second test session backdated by 10 seconds")
+    is_expired = session.is_expired
+    logger.debug("Expired: %s", is_expired)
 
-            # Test heartbeat API (unauthenticated)
-            response = client.post('/session/heartbeat')
-            print(f"✅ Session heartbeat API: {response.status_code} (should be 302 - redirect to login)")
+    # Test validation function
+    is_valid, message = validate_session_time(session)
+    logger.debug("Validation result: valid=%s, message='%s'", is_valid, message)
 
-            # Test questions API (unauthenticated)
-            response = client.get('/get_questions')
-            print(f"✅ Get questions API: {response.status_code} (should be 302 - redirect to login)")
+    # validate_session_time mutated this same identity-map object, so
+    # its status is current without a refresh round-trip
+    logger.debug("Final status: %s", session.status)
 
-            return True
+    assert is_expired and not is_valid and \
+        session.status in ['timeout', 'active'], \
+        "Session expiration not working as expected"
 
 
-def test_template_rendering():
+def test_quiz_scoring(db_session, sample_user, sample_questions):
+    """Test quiz scoring with session integration"""
+    user = sample_user
+    questions = sample_questions
+
+    logger.debug("Testing with %s questions", len(questions))
+
+    # Create session
+    session = QuizSession(user_id=user.id, time_limit_minutes=10)
+    # flush assigns the ID without ending the transaction
+    db.session.add(session)
+    db.session.flush()
+
+    # Create form data with correct answers
+    form_data = {}
+    for q in questions:
+        form_data[str(q.id)] = q.answer
+        logger.debug("Q%s: %s... = '%s'", q.id, q.question[:50], q.answer)
+
+    # Test scoring calculation
+    score = calculate_score(form_data, questions)
+    expected_score = len(questions)
+
+    logger.debug("Calculated score: %s/%s (expected %s)",
+                 score, len(questions), expected_score)
+
+    assert score == expected_score, "Quiz scoring not working as expected"
+
+    # Test session completion
+    session.complete_session(score=score, total_questions=len(questions))
+    db.session.flush()
+
+    logger.debug("Session completed with status: %s", session.status)
+    logger.debug("Final score: %s/%s", session.score, session.total_questions)
+
+
+@pytest.mark.parametrize('method,url,expected', [
+    # Public pages
+    ('GET', '/', 200),
+    ('GET', '/login', 200),
+    # Unauthenticated quiz and API routes redirect to login
+    ('GET', '/quiz', 302),
+    ('GET', '/quiz_status', 302),
+    ('POST', '/quiz/abandon', 302),
+    ('GET', '/session/status', 302),
+    ('POST', '/session/heartbeat', 302),
+    ('GET', '/get_questions', 302),
+])
+def test_endpoint(client, method, url, expected):
+    """Each endpoint answers with the expected status for a guest"""
+    response = client.open(url, method=method)
+    logger.debug("%s %s: %s", method, url, response.status_code)
+    assert response.status_code == expected
+
+
+def test_template_rendering(app, db_session, sample_user, sample_questions):
     """Test that templates can render without errors"""
-    print("\n🧪 Testing Template Rendering...")
-
-    app = create_app()
-    with app.app_context():
-        user = User.query.first()
-        questions = Questions.query.limit(3).all()
-
-        if not user or not questions:
-            print("❌ Need user and questions for template test")
-            return False
-
-        # Create a test session
-        session = QuizSession(user_id=user.id, time_limit_minutes=30)
-        db.session.add(session)
-        db.session.commit()
-
-        try:
-            # Test rendering the timed template (this would normally require authentication)
-            with app.test_request_context():
-                from flask import render_template_string
-
-                # Test basic template variables
-                template_vars = {
-                    'questions': questions,
-                    'session': session.to_dict(),
-                    'time_limit_seconds': session.time_limit_minutes * 60,
-                    'current_user': user
-                }
-
-                print("✅ Template variables prepared:")
-                print(f"   Questions: {len(template_vars['questions'])}")
-                print(f"   Session ID: {template_vars['session']['id']}")
-                print(f"   Time limit: {template_vars['time_limit_seconds']} seconds")
-                print(f"   User: {template_vars['current_user'].first_name}")
-
-        except Exception as e:
-            print(f"❌ Template rendering error: {str(e)}")
-            return False
-
-        finally:
-            # Clean up
-            db.session.delete(session)
-            db.session.commit()
-
-        print("✅ Template rendering test passed")
-        return True
-
-
-def run_all_tests():
-    """Run all timed quiz tests"""
-    print("🚀 TIMED QUIZ FUNCTIONALITY TEST SUITE")
-    print("=" * 60)
-
-    tests = [
-        ("Session Creation", test_session_creation),
-        ("Timing Calculations", test_timing_calculations),
-        ("Session Expiration", test_session_expiration),
-        ("Quiz Scoring", test_quiz_scoring),
-        ("Web Interface", test_web_interface),
-        ("API Endpoints", test_api_endpoints),
-        ("Template Rendering", test_template_rendering)
-    ]
-
-    results = []
-
-    for test_name, test_func in tests:
-        try:
-            print(f"\n📋 Running: {test_name}")
-            result = test_func()
-            results.append((test_name, result))
-
-            if result:
-                print(f"✅ {test_name}: PASSED")
-            else:
-                print(f"❌ {test_name}: FAILED")
-
-        except Exception as e:
-            print(f"💥 {test_name}: ERROR - {str(e)}")
-            results.append((test_name, False))
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 TEST RESULTS SUMMARY")
-    print("=" * 60)
-
-    passed = sum(1 for _, result in results if result)
-    failed = len(results) - passed
-
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} {test_name}")
-
-    print("\n" + "-" * 60)
-    print(f"Total Tests: {len(results)}")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
-    print(f"Success Rate: {(passed/len(results)*100):.1f}%")
-
-    if failed == 0:
-        print("\n🎉 ALL TESTS PASSED! Timed quiz functionality is working correctly.")
-        print("✅ CSRF token error has been resolved.")
-        print("✅ Time limits implementation is ready for use.")
-        return True
-    else:
-        print(f"\n⚠️  {failed} test(s) failed. Please review the output above.")
-        return False
-
-
-def main():
-    """Main test runner"""
-    try:
-        success = run_all_tests()
-        sys.exit(0 if success else 1)
-    except KeyboardInterrupt:
-        print("\n⏹️  Tests interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n💥 Unexpected error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+    user = sample_user
+    questions = sample_questions
+
+    # Create a test session
+    session = QuizSession(user_id=user.id, time_limit_minutes=30)
+    # flush assigns the ID without ending the transaction
+    db.session.add(session)
+    db.session.flush()
+
+    # Render the real timed template with the same variables the /quiz
+    # route passes, so the test actually exercises Jinja
+    with app.test_request_context():
+        from flask import render_template
+
+        rendered = render_template(
+            'questions_timed.html',
+            questions=questions,
+            session=session.to_dict(),
+            time_limit_seconds=session.time_limit_minutes * 60
+        )
+
+    logger.debug("Rendered %s characters", len(rendered))
+    assert rendered
+    assert questions[0].question in rendered